@@ -1,31 +1,65 @@
-
 """
 Example script demonstrating how to use the NextDataExtractor class
 to extract pageProps data from Next.js pages and save them to JSON files.
 """
-from typing import Dict, Any, Optional
+import argparse
+from typing import Dict, List, Optional
 from utils.generic import read_json_file
 from utils.next_data_extractor import NextDataExtractor
 
 
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+
+    Returns:
+        argparse.Namespace: The parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Extract pageProps from Next.js pages and save them to JSON files.")
+    parser.add_argument("--config", default="website_details.json",
+                        help="JSON file with the homepage_url and page_url (default: website_details.json)")
+    parser.add_argument("--url", dest="urls", action="append", metavar="URL",
+                        help="Page URL to extract, can be repeated (default: page_url from the config file)")
+    parser.add_argument("--no-headless", dest="headless", action="store_false",
+                        help="Show the browser window, useful for debugging")
+    parser.add_argument("--fast", action="store_true",
+                        help="Read __NEXT_DATA__ over plain HTTP first, only starting a browser when that fails")
+    parser.add_argument("--human-delay", action="store_true",
+                        help="Add random pauses and scrolling to simulate human behavior")
+    parser.add_argument("--workers", type=int, default=5,
+                        help="Number of browsers used when extracting several pages (default: 5)")
+    args = parser.parse_args()
+
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    return args
+
+
 if __name__ == "__main__":
-    # Extract pageProps from a single page and save to a JSON file
-    print("\n Extract pageProps from a single page and save to a JSON file")
-    website_details: Optional[Dict[str, str]] = read_json_file("website_details.json")
+    args = parse_args()
+
+    website_details: Optional[Dict[str, str]] = read_json_file(args.config)
 
     if website_details is None:
-        print("Failed to read website_details.json")
+        print(f"Failed to read {args.config}")
         exit(1)
 
     homepage_url: str = website_details["homepage_url"]
-    single_page_url: str = website_details["page_url"]
+    page_urls: List[str] = args.urls or [website_details["page_url"]]
 
     # Use the extractor as a context manager
-    with NextDataExtractor(homepage_url, headless=True) as extractor:
-        # Extract data and save to a JSON file
-        success: bool = extractor.extract_and_save(single_page_url)
+    with NextDataExtractor(homepage_url, headless=args.headless, human_delay=args.human_delay,
+                           fast_mode=args.fast) as extractor:
+        if len(page_urls) == 1:
+            # Extract pageProps from a single page and save to a JSON file
+            results: List[bool] = [extractor.extract_and_save(page_urls[0])]
+        else:
+            # Extract pageProps from several pages concurrently
+            results = extractor.extract_and_save_many(page_urls, max_workers=args.workers)
 
+    for page_url, success in zip(page_urls, results):
         if success:
-            print(f"Successfully extracted and saved data from {single_page_url}")
+            print(f"Successfully extracted and saved data from {page_url}")
         else:
-            print(f"Failed to extract data from {single_page_url}")
+            print(f"Failed to extract data from {page_url}")
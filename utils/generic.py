@@ -1,7 +1,19 @@
 import os
+import re
 import json
 from typing import Dict, Any, Optional, Union
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Protocol prefix that is left out of file names
+_SCHEME_RE = re.compile(r"^https?://")
+
+# Characters that are replaced with underscores in file names
+_SAFE_FILENAME_RE = re.compile(r"[^A-Za-z0-9]")
+
 def read_json_file(filepath: str) -> Optional[Dict[str, Any]]:
     """
     Read data from a saved JSON file.
@@ -13,13 +25,16 @@ def read_json_file(filepath: str) -> Optional[Dict[str, Any]]:
         dict: The data from the JSON file or None if reading failed
     """
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+        # Read the raw bytes so orjson can parse them without decoding to str first
+        with open(filepath, "rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception as e:
         print(f"Error reading data from {filepath}: {e}")
         return None
 
-def save_data_to_json(data: Dict[str, Any], url: str, folder: str = "data") -> Optional[str]:
+def save_data_to_json(data: Dict[str, Any], url: str, folder: str = "data", pretty: bool = False,
+                      fsync: bool = False) -> Optional[str]:
     """
     Save the extracted data to a JSON file in the specified folder.
 
@@ -27,6 +42,9 @@ def save_data_to_json(data: Dict[str, Any], url: str, folder: str = "data") -> O
         data (dict): The data to save
         url (str): The URL of the page the data was extracted from
         folder (str): The folder to save the data to (default: "data")
+        pretty (bool): Whether to indent the JSON for readability (default: False, compact output)
+        fsync (bool): Whether to force the file to disk before returning (default: False,
+            the operating system writes it back in its own time)
 
     Returns:
         str: The path to the saved file or None if saving failed
@@ -36,18 +54,27 @@ def save_data_to_json(data: Dict[str, Any], url: str, folder: str = "data") -> O
         os.makedirs(folder, exist_ok=True)
 
         # Create a filename based on the URL
-        # Replace non-alphanumeric characters with underscores
-        # Remove protocol (http:// or https://)
-        clean_url = url.replace("http://", "").replace("https://", "")
-        # Replace special characters with underscores
-        filename = "".join(c if c.isalnum() else "_" for c in clean_url)
+        # Remove protocol (http:// or https://) and replace non-alphanumeric characters with underscores
+        filename = _SAFE_FILENAME_RE.sub("_", _SCHEME_RE.sub("", url))
         # Limit filename length and add .json extension
         filename = filename[:100] + ".json"
         filepath = os.path.join(folder, filename)
 
+        # Serialize the data up front so it is written to disk in a single call
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+            payload = orjson.dumps(data, option=option)
+        elif pretty:
+            payload = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+        else:
+            payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
         # Save the data to a JSON file
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(filepath, "wb") as f:
+            f.write(payload)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
 
         print(f"Data saved to {filepath}")
         return filepath
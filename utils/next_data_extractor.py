@@ -2,11 +2,21 @@
 Utility module for extracting pageProps data from Next.js pages.
 
 This module provides a class to extract data from the __NEXT_DATA__ script tag
-that is present in Next.js server-rendered pages using Selenium.
+that is present in Next.js server-rendered pages using Selenium, and a faster
+function that reads the script tag straight from the HTML over plain HTTP.
 """
 
+import asyncio
 import json
-from typing import Dict, Optional, Any, List
+import queue
+import re
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Optional, Any, List, Collection, FrozenSet, Tuple
+from urllib.parse import urlsplit
+import requests
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -17,24 +27,19 @@ import platform
 import time
 import random
 
-from utils.generic import save_data_to_json
-
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class NextDataExtractor:
-    """
-    A class for extracting pageProps data from Next.js pages using Selenium.
-
-    This class can be used as a context manager to ensure proper cleanup of resources:
+from utils.generic import save_data_to_json
 
-    Example:
-        ```python
-        with NextDataExtractor(homepage_url) as extractor:
-            page_props = extractor.extract_page_props(page_url)
-        ```
-    """
+# Browser identity shared by Chrome and the plain HTTP client
+_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+_ACCEPT_LANGUAGE = "nl-NL,nl;q=0.9,en-US;q=0.8,en;q=0.7"
 
-    # Default list of analytics and tracking domains to block
-    DEFAULT_BLOCKED_DOMAINS = [
+# Default set of analytics and tracking domains to block
+_DEFAULT_BLOCKED_DOMAINS: FrozenSet[str] = frozenset([
     "plausible.io",
     "google-analytics.com",
     "analytics.google.com",
@@ -63,37 +68,332 @@ class NextDataExtractor:
     "clicky.com",
     "newrelic.com",
     "adobe.com",
-    "crazyegg.com"
+    "crazyegg.com",
+])
+
+# The Chrome argument for the default domains only needs to be built once
+_DEFAULT_BLOCKED_DOMAINS_ARG = "--host-blocking-patterns=" + ",".join(sorted(_DEFAULT_BLOCKED_DOMAINS))
+
+# Subresources that are never needed to read __NEXT_DATA__, which is inlined in the HTML
+_BLOCKED_RESOURCE_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.css",
+    "*.mp4", "*.webm",
 ]
 
+_NEXT_DATA_RE = re.compile(rb'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+
+# Ranges (in seconds) of the random pauses taken on each page when human_delay is enabled.
+# The reading pause comes before the scroll; the pauses after scrolling and for letting
+# JavaScript settle are slept together once the page has finished loading.
+_HUMAN_READING_PAUSE_RANGE = (3, 5)
+_HUMAN_SETTLE_PAUSE_RANGES = ((1, 2), (2, 3))
+
+
+# ChromeDriver path resolved by webdriver-manager, shared by every driver in this process
+_CACHED_DRIVER_PATH: Optional[str] = None
+_DRIVER_PATH_LOCK = threading.Lock()
+
+
+def _get_driver_path() -> str:
+    """
+    Get the ChromeDriver executable path from webdriver-manager.
+
+    The install check contacts the online version manifest, so it only runs for the
+    first driver; later drivers reuse the resolved path.
+
+    Returns:
+        str: Path to the ChromeDriver executable
+    """
+    global _CACHED_DRIVER_PATH
+    with _DRIVER_PATH_LOCK:
+        if _CACHED_DRIVER_PATH is None:
+            from webdriver_manager.chrome import ChromeDriverManager
+            _CACHED_DRIVER_PATH = ChromeDriverManager().install()
+        return _CACHED_DRIVER_PATH
+
+
+def _build_default_options() -> Options:
+    """
+    Build the Chrome options that are the same for every extractor.
+
+    Returns:
+        Options: Chrome options without the per-instance settings (headless mode,
+            page load strategy and blocked domains)
+    """
+    chrome_options = Options()
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--window-size=1920,1080")
+
+    # Enhanced anti-bot detection measures
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-popup-blocking")
+    chrome_options.add_argument("--disable-infobars")
+    chrome_options.add_argument("--disable-notifications")
+    chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option("useAutomationExtension", False)
+
+    # Add realistic user agent
+    chrome_options.add_argument(f"--user-agent={_USER_AGENT}")
+
+    # Add language preferences
+    chrome_options.add_argument(f"--lang={_ACCEPT_LANGUAGE}")
+
+    # Don't load images and don't ask for notification permissions
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+    })
+
+    return chrome_options
+
+
+def _parse_page_props(raw: bytes) -> Dict[str, Any]:
+    """
+    Parse a __NEXT_DATA__ payload and return its pageProps.
+
+    Args:
+        raw (bytes): The UTF-8 encoded JSON content of the __NEXT_DATA__ script
+
+    Returns:
+        dict: The pageProps data
+
+    Raises:
+        ValueError: If the payload has no 'props.pageProps'
+    """
+    # orjson is considerably faster on large payloads
+    next_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    # Validate the expected structure exists
+    if 'props' in next_data and 'pageProps' in next_data['props']:
+        return next_data['props']['pageProps']
+    else:
+        raise ValueError("Missing 'props.pageProps' in __NEXT_DATA__")
+
+
+def _create_http_session(homepage_url: str) -> requests.Session:
+    """
+    Create an HTTP session that presents itself like the Selenium browser.
+
+    The homepage is requested once so the session picks up its cookies.
+
+    Args:
+        homepage_url (str): The homepage URL of the website (used for cookie handling)
 
-    def __init__(self, homepage_url: str, headless: bool = True, blocked_domains: Optional[List[str]] = None) -> None:
+    Returns:
+        requests.Session: The prepared session
+    """
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": _USER_AGENT,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": _ACCEPT_LANGUAGE,
+    })
+    try:
+        session.get(homepage_url, timeout=30)
+    except requests.RequestException as e:
+        print(f"Error loading homepage {homepage_url}: {e}")
+    return session
+
+
+def extract_next_data_fast(homepage_url: str, page_url: str,
+                           session: Optional[requests.Session] = None) -> Optional[Dict[str, Any]]:
+    """
+    Extract pageProps data from a Next.js page without a browser.
+
+    Server-rendered Next.js pages contain the __NEXT_DATA__ script in the HTML response,
+    so it can be read with a plain HTTP request. Pages that block the request or only
+    render their data with JavaScript return None and need the Selenium extractor.
+
+    Args:
+        homepage_url (str): The homepage URL of the website (used for cookie handling)
+        page_url (str): The URL of the Next.js page to extract data from
+        session (requests.Session, optional): Session to reuse for connection pooling across calls.
+            If None, a new session is created (and closed) for this call
+
+    Returns:
+        dict: The pageProps data or None if it could not be extracted over HTTP
+    """
+    own_session = session is None
+    if own_session:
+        session = _create_http_session(homepage_url)
+
+    try:
+        response = session.get(page_url, headers={"Referer": homepage_url}, timeout=30)
+        if response.status_code == 403:
+            print(f"Request for {page_url} was blocked (403)")
+            return None
+        response.raise_for_status()
+
+        match = _NEXT_DATA_RE.search(response.content)
+        if match is None:
+            print(f"No __NEXT_DATA__ script found in the HTML of {page_url}")
+            return None
+
+        return _parse_page_props(match.group(1))
+    except Exception as e:
+        print(f"Error extracting data over HTTP: {e}")
+        return None
+    finally:
+        if own_session:
+            session.close()
+
+
+def _save_page_props(page_url: str, page_props: Optional[Dict[str, Any]]) -> bool:
+    """
+    Save extracted pageProps data to a JSON file and report the outcome.
+
+    Args:
+        page_url (str): The URL of the Next.js page the data was extracted from
+        page_props (dict, optional): The extracted pageProps data or None if extraction failed
+
+    Returns:
+        bool: True if extraction and saving succeeded, False otherwise
+    """
+    if page_props is not None:
+        print("Successfully extracted pageProps")
+        # Save the data to a JSON file
+        return save_data_to_json(page_props, page_url) is not None
+    else:
+        print("Failed to extract pageProps")
+        print("Try running with headless=False to see what's happening in the browser")
+        print("Or check the error messages above for more details on what went wrong")
+        return False
+
+
+async def extract_many_async(page_urls: List[str], concurrency: int = 20) -> List[bool]:
+    """
+    Extract pageProps data from many Next.js pages over HTTP and save each to a JSON file.
+
+    The pages are grouped by host. Hosts are processed concurrently (at most `concurrency`
+    at a time), while the pages of one host are fetched one after another over a shared
+    session, so no single site receives parallel requests. The root URL of each host is
+    used as its homepage for cookie handling.
+
+    Args:
+        page_urls (List[str]): The URLs of the Next.js pages to extract data from
+        concurrency (int): Maximum number of hosts processed at once
+
+    Returns:
+        List[bool]: For each URL, in input order, True if extraction and saving succeeded.
+            Pages that need a browser are reported as False and can be retried with NextDataExtractor
+    """
+    pages_by_host: Dict[str, List[str]] = defaultdict(list)
+    for page_url in page_urls:
+        parts = urlsplit(page_url)
+        pages_by_host[f"{parts.scheme}://{parts.netloc}/"].append(page_url)
+
+    results: Dict[str, bool] = {}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    # requests and file writes are blocking, so they run on worker threads
+    async def process_host(homepage_url: str, host_page_urls: List[str]) -> None:
+        async with semaphore:
+            session = await asyncio.to_thread(_create_http_session, homepage_url)
+            try:
+                for page_url in host_page_urls:
+                    page_props = await asyncio.to_thread(extract_next_data_fast, homepage_url, page_url, session)
+                    results[page_url] = await asyncio.to_thread(_save_page_props, page_url, page_props)
+            finally:
+                session.close()
+
+    await asyncio.gather(*(process_host(homepage_url, host_page_urls)
+                           for homepage_url, host_page_urls in pages_by_host.items()))
+
+    return [results[page_url] for page_url in page_urls]
+
+
+def _to_cdp_cookie(cookie: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert a cookie returned by WebDriver.get_cookies() to a CDP Network.CookieParam.
+
+    Args:
+        cookie (dict): The cookie as returned by Selenium
+
+    Returns:
+        dict: The cookie in the format expected by Network.setCookies
+    """
+    cdp_cookie: Dict[str, Any] = {
+        key: cookie[key]
+        for key in ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite")
+        if key in cookie
+    }
+    if "expiry" in cookie:
+        cdp_cookie["expires"] = cookie["expiry"]
+    return cdp_cookie
+
+
+class NextDataExtractor:
+    """
+    A class for extracting pageProps data from Next.js pages using Selenium.
+
+    This class can be used as a context manager to ensure proper cleanup of resources:
+
+    Example:
+        ```python
+        with NextDataExtractor(homepage_url) as extractor:
+            page_props = extractor.extract_page_props(page_url)
+        ```
+    """
+
+    # Default set of analytics and tracking domains to block
+    DEFAULT_BLOCKED_DOMAINS: FrozenSet[str] = _DEFAULT_BLOCKED_DOMAINS
+
+
+    def __init__(self, homepage_url: str, headless: bool = True, blocked_domains: Optional[Collection[str]] = None,
+                 human_delay: bool = False, page_load_strategy: str = "eager", fast_mode: bool = False) -> None:
         """
         Initialize the NextDataExtractor with the homepage URL and browser settings.
 
         Args:
             homepage_url (str): The homepage URL of the website (used for cookie handling)
             headless (bool): Whether to run the browser in headless mode
-            blocked_domains (List[str], optional): List of domains to block. If None, uses DEFAULT_BLOCKED_DOMAINS
+            blocked_domains (Collection[str], optional): Domains to block (e.g. a list or set). If None, uses DEFAULT_BLOCKED_DOMAINS
+            human_delay (bool): Whether to add random pauses and scrolling to simulate human behavior,
+                for sites with anti-bot checks that require it
+            page_load_strategy (str): WebDriver page load strategy ("normal", "eager" or "none").
+                "eager" returns once the HTML is parsed, which is all __NEXT_DATA__ needs
+            fast_mode (bool): Whether to first try reading __NEXT_DATA__ over plain HTTP,
+                only starting a browser when that fails
         """
         self.homepage_url: str = homepage_url
         self.headless: bool = headless
-        self.blocked_domains: List[str] = blocked_domains if blocked_domains is not None else self.DEFAULT_BLOCKED_DOMAINS
+        self.human_delay: bool = human_delay
+        self.page_load_strategy: str = page_load_strategy
+        self.fast_mode: bool = fast_mode
+        self.blocked_domains: Collection[str] = blocked_domains if blocked_domains is not None else self.DEFAULT_BLOCKED_DOMAINS
         self.driver: Optional[webdriver.Chrome] = None
+        self._session: Optional[requests.Session] = None
+        self._cookies_seeded: bool = False
+        self._cached_cookies: List[Dict[str, Any]] = []
+        self._cookie_lock: threading.Lock = threading.Lock()
         self.chrome_options: Options = self._configure_chrome_options()
 
     def __enter__(self) -> 'NextDataExtractor':
         """
-        Enter the context manager.
+        Enter the context manager and start the WebDriver that is reused for every page.
+
+        In fast mode the WebDriver is only started when a page has to fall back to Selenium.
+        If the WebDriver fails to start, the error is reported and the start is retried
+        (and reported again) when a page is extracted.
 
         Returns:
             NextDataExtractor: The instance itself
         """
+        if not self.fast_mode:
+            try:
+                self._initialize_driver()
+            except Exception as e:
+                print(f"Error starting WebDriver: {e}")
         return self
 
     def __exit__(self, exc_type: Optional[type], exc_val: Optional[Exception], exc_tb: Optional[Any]) -> None:
         """
-        Exit the context manager and ensure the driver is closed.
+        Exit the context manager and ensure the driver and HTTP session are closed.
 
         Args:
             exc_type: Exception type if an exception was raised
@@ -101,6 +401,7 @@ class NextDataExtractor:
             exc_tb: Exception traceback if an exception was raised
         """
         self._close_driver()
+        self._close_session()
 
     def _configure_chrome_options(self) -> Options:
         """
@@ -109,73 +410,114 @@ class NextDataExtractor:
         Returns:
             Options: Configured Chrome options
         """
-        chrome_options = Options()
+        chrome_options = _build_default_options()
         if self.headless:
             chrome_options.add_argument("--headless=new")  # Use the new headless mode
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-
-        # Enhanced anti-bot detection measures
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-popup-blocking")
-        chrome_options.add_argument("--disable-infobars")
-        chrome_options.add_argument("--disable-notifications")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-
-        # Add realistic user agent
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36")
 
-        # Add language preferences
-        chrome_options.add_argument("--lang=nl-NL,nl;q=0.9,en-US;q=0.8,en;q=0.7")
-
-        # Set page load timeout
-        chrome_options.page_load_strategy = "normal"
+        # Don't wait for images, fonts and other subresources unless asked to
+        chrome_options.page_load_strategy = self.page_load_strategy
 
         # Block requests to analytics and tracking domains to prevent timeout errors
-        if self.blocked_domains:
+        if self.blocked_domains is _DEFAULT_BLOCKED_DOMAINS:
+            chrome_options.add_argument(_DEFAULT_BLOCKED_DOMAINS_ARG)
+        elif self.blocked_domains:
             # Join domains with comma for the Chrome host-blocking-patterns argument
             blocked_domains_str = ",".join(self.blocked_domains)
             chrome_options.add_argument(f"--host-blocking-patterns={blocked_domains_str}")
 
         return chrome_options
 
-    def _initialize_driver(self) -> None:
+    def _create_driver(self) -> webdriver.Chrome:
         """
-        Initialize the Selenium WebDriver.
+        Create a new Selenium WebDriver using the configured Chrome options.
+
+        Returns:
+            webdriver.Chrome: The newly created WebDriver
 
         Raises:
             Exception: If the WebDriver initialization fails
         """
         exceptions: List[str] = []
+        driver: Optional[webdriver.Chrome] = None
 
         # On Windows, try multiple approaches
         if platform.system() == 'Windows':
             # Approach 1: Try to create a Chrome driver directly with Service object
             try:
                 service = Service()
-                self.driver = webdriver.Chrome(service=service, options=self.chrome_options)
-                return
+                driver = webdriver.Chrome(service=service, options=self.chrome_options)
             except Exception as e:
                 exceptions.append(f"Windows approach failed: {str(e)}")
 
         else:
             # Approach 2: On non-Windows platforms, use webdriver-manager
             try:
-                from webdriver_manager.chrome import ChromeDriverManager
-                service = Service(ChromeDriverManager().install())
-                self.driver = webdriver.Chrome(service=service, options=self.chrome_options)
-                return
+                service = Service(_get_driver_path())
+                driver = webdriver.Chrome(service=service, options=self.chrome_options)
             except Exception as e:
                 exceptions.append(f"Non-Windows approach failed: {str(e)}")
 
+        if driver is not None:
+            try:
+                # Set page load timeout
+                driver.set_page_load_timeout(30)
+
+                # Skip downloading images, fonts, stylesheets and media
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": _BLOCKED_RESOURCE_PATTERNS})
+
+                self._seed_cookies(driver)
+            except Exception:
+                driver.quit()
+                raise
+            return driver
+
         # If both approaches failed, raise an exception with details
         error_details: str = "\n".join(exceptions)
         raise Exception(f"Failed to create Chrome WebDriver after multiple attempts:\n{error_details}")
 
+    def _seed_cookies(self, driver: webdriver.Chrome) -> None:
+        """
+        Give a freshly created WebDriver the cookies set by the homepage.
+
+        The homepage is only visited by the first driver. Its cookies are cached and
+        injected into every later driver through the DevTools protocol, which, unlike
+        driver.add_cookie(), does not require navigating to the site first. If the
+        homepage can't be loaded, the driver is used without cookies and the next
+        driver that is created tries the homepage again.
+
+        Args:
+            driver (webdriver.Chrome): The WebDriver to seed
+        """
+        with self._cookie_lock:
+            if not self._cookies_seeded:
+                try:
+                    # Add cookies for the domain (if needed)
+                    driver.get(self.homepage_url)
+
+                    if self.human_delay:
+                        # Wait a bit to simulate human behavior
+                        time.sleep(random.uniform(2, 4))
+
+                    self._cached_cookies = driver.get_cookies()
+                    self._cookies_seeded = True
+                except Exception as e:
+                    print(f"Error loading homepage {self.homepage_url}, continuing without its cookies: {e}")
+                return
+
+        if self._cached_cookies:
+            cookies = [_to_cdp_cookie(cookie) for cookie in self._cached_cookies]
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+
+    def _initialize_driver(self) -> None:
+        """
+        Initialize the Selenium WebDriver.
+
+        Raises:
+            Exception: If the WebDriver initialization fails
+        """
+        self.driver = self._create_driver()
+
     def _close_driver(self) -> None:
         """
         Close the Selenium WebDriver if it exists.
@@ -184,74 +526,102 @@ class NextDataExtractor:
             self.driver.quit()
             self.driver = None
 
-    def extract_page_props(self, page_url: str) -> Optional[Dict[str, Any]]:
+    def _get_session(self) -> requests.Session:
         """
-        Extract pageProps data from a Next.js page.
-
-        Args:
-            page_url (str): The URL of the Next.js page to extract data from
+        Get the HTTP session used in fast mode, creating it on first use.
 
         Returns:
-            dict: The pageProps data or None if not found
+            requests.Session: The session shared by all fast mode requests of this extractor
         """
-        try:
-            self._initialize_driver()
+        if self._session is None:
+            self._session = _create_http_session(self.homepage_url)
+        return self._session
+
+    def _close_session(self) -> None:
+        """
+        Close the HTTP session if it exists.
+        """
+        if self._session:
+            self._session.close()
+            self._session = None
 
-            # Set page load timeout
-            self.driver.set_page_load_timeout(30)
+    def _extract_page_props_with_driver(self, driver: webdriver.Chrome, page_url: str) -> Dict[str, Any]:
+        """
+        Extract pageProps data from a Next.js page using an already running WebDriver.
 
-            # Add cookies for the domain (if needed)
-            self.driver.get(self.homepage_url)
+        Args:
+            driver (webdriver.Chrome): The WebDriver to navigate with
+            page_url (str): The URL of the Next.js page to extract data from
 
-            # Wait a bit to simulate human behavior
-            time.sleep(random.uniform(2, 4))
+        Returns:
+            dict: The pageProps data
 
-            # Navigate to the actual URL
-            self.driver.get(page_url)
+        Raises:
+            Exception: If the page could not be loaded or holds no valid pageProps
+        """
+        # Navigate to the actual URL (the homepage cookies were set when the driver was created)
+        driver.get(page_url)
 
+        if self.human_delay:
             # Add random pauses to simulate human behavior
-            time.sleep(random.uniform(3, 5))
+            time.sleep(random.uniform(*_HUMAN_READING_PAUSE_RANGE))
 
-            # Scroll down a bit to trigger any lazy-loading
-            self.driver.execute_script("window.scrollBy(0, 300);")
-            time.sleep(random.uniform(1, 2))
+            # Scroll down a bit like a visitor would
+            driver.execute_script("window.scrollBy(0, 300);")
 
             # Wait for the page to load completely
-            WebDriverWait(self.driver, 30).until(
+            WebDriverWait(driver, 30).until(
                 lambda d: d.execute_script("return document.readyState") == "complete"
             )
 
-            # Additional wait to ensure JavaScript has executed
-            time.sleep(random.uniform(2, 3))
+            # Pause after scrolling and let JavaScript settle, slept in one go
+            time.sleep(sum(random.uniform(low, high) for low, high in _HUMAN_SETTLE_PAUSE_RANGES))
+
+        # __NEXT_DATA__ is rendered server-side, so it is available as soon as the HTML is parsed
+        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "__NEXT_DATA__")))
+
+        # Read the script content in a single WebDriver command
+        script_text = driver.execute_script(
+            "var e = document.getElementById('__NEXT_DATA__'); return e ? e.textContent : '';"
+        ) or ""
 
-            # Find and extract data from the __NEXT_DATA__ script
-            WebDriverWait(self.driver, 10).until(EC.presence_of_element_located((By.ID, "__NEXT_DATA__")))
-            next_data_script = self.driver.find_element(By.ID, "__NEXT_DATA__")
-            script_text = next_data_script.get_attribute("textContent") or next_data_script.get_attribute("text") or ""
+        # Validate that we have text content before trying to parse it
+        if not script_text or script_text.strip() == "":
+            raise ValueError("Empty __NEXT_DATA__ script content")
 
-            # Validate that we have text content before trying to parse it
-            if not script_text or script_text.strip() == "":
-                raise ValueError("Empty __NEXT_DATA__ script content")
+        # Debug information
+        print(f"__NEXT_DATA__ script found with length: {len(script_text)}")
+        if len(script_text) > 100:
+            print(f"Sample of script content: {script_text[:100]}...")
 
-            # Debug information
-            print(f"__NEXT_DATA__ script found with length: {len(script_text)}")
-            if len(script_text) > 100:
-                print(f"Sample of script content: {script_text[:100]}...")
+        return _parse_page_props(script_text.encode("utf-8"))
 
-            # Try to parse the JSON
-            next_data = json.loads(script_text)
+    def extract_page_props(self, page_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Extract pageProps data from a Next.js page.
+
+        The WebDriver is started on first use and kept open for later pages. Use the
+        extractor as a context manager to make sure it is closed afterwards.
+
+        Args:
+            page_url (str): The URL of the Next.js page to extract data from
 
-            # Validate the expected structure exists
-            if 'props' in next_data and 'pageProps' in next_data['props']:
-                return next_data['props']['pageProps']
-            else:
-                raise ValueError("Missing 'props.pageProps' in __NEXT_DATA__")
+        Returns:
+            dict: The pageProps data or None if not found
+        """
+        if self.fast_mode:
+            page_props = extract_next_data_fast(self.homepage_url, page_url, session=self._get_session())
+            if page_props is not None:
+                return page_props
+            print("Falling back to Selenium...")
 
+        try:
+            if self.driver is None:
+                self._initialize_driver()
+            return self._extract_page_props_with_driver(self.driver, page_url)
         except Exception as e:
             print(f"Error extracting data with Selenium: {e}")
             return None
-        finally:
-            self._close_driver()
 
     def extract_and_save(self, page_url: str) -> bool:
         """
@@ -263,23 +633,121 @@ class NextDataExtractor:
         Returns:
             bool: True if extraction and saving succeeded, False otherwise
         """
-        print("Extracting pageProps with Selenium...")
+        print("Extracting pageProps...")
         page_props = self.extract_page_props(page_url)
+        return _save_page_props(page_url, page_props)
 
-        if page_props:
-            print("Successfully extracted pageProps with Selenium")
-            # Save the data to a JSON file
-            save_data_to_json(page_props, page_url)
-            return True
-        else:
-            print("Failed to extract pageProps with Selenium")
-            print("Try running with headless=False to see what's happening in the browser")
-            print("Or check the error messages above for more details on what went wrong")
-            return False
+    def _extract_and_save_pooled(self, drivers: "queue.Queue[webdriver.Chrome]", stagger_count: int,
+                                 index: int, page_url: str) -> bool:
+        """
+        Extract and save a single page using a WebDriver borrowed from the pool.
+
+        Args:
+            drivers (queue.Queue): Pool of running WebDrivers shared between worker threads
+            stagger_count (int): Number of leading tasks whose start is staggered
+            index (int): Position of the page in the batch
+            page_url (str): The URL of the Next.js page to extract data from
+
+        Returns:
+            bool: True if extraction and saving succeeded, False otherwise
+        """
+        # Stagger the first wave of workers so they don't hit the site at the same moment
+        if index < stagger_count:
+            time.sleep(index * 0.1)
+
+        driver = drivers.get()
+        try:
+            print(f"Extracting pageProps from {page_url} with Selenium...")
+            page_props = self._extract_page_props_with_driver(driver, page_url)
+        except Exception as e:
+            print(f"Error extracting data from {page_url} with Selenium: {e}")
+            page_props = None
+        finally:
+            drivers.put(driver)
+
+        return _save_page_props(page_url, page_props)
+
+    def extract_and_save_many(self, page_urls: List[str], max_workers: int = 20) -> List[bool]:
+        """
+        Extract pageProps data from several Next.js pages concurrently and save each to a JSON file.
+
+        A pool of WebDrivers (one per worker thread) is started up front and shared between
+        the workers, so every page is handled by an already running browser. The extractor's
+        own WebDriver, if running, is part of the pool.
+
+        In fast mode every page is first read over plain HTTP, one after another over the
+        shared session so the site never receives parallel requests. Browsers are only
+        started for the pages that need the Selenium fallback.
+
+        Args:
+            page_urls (List[str]): The URLs of the Next.js pages to extract data from
+            max_workers (int): Maximum number of pages processed (and browsers running) at once
+
+        Returns:
+            List[bool]: For each URL, in input order, True if extraction and saving succeeded
+
+        Raises:
+            ValueError: If max_workers is less than 1
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        results: List[bool] = [False] * len(page_urls)
+        pending: List[Tuple[int, str]] = list(enumerate(page_urls))
+
+        if self.fast_mode:
+            session = self._get_session()
+            pending = []
+            for index, page_url in enumerate(page_urls):
+                page_props = extract_next_data_fast(self.homepage_url, page_url, session=session)
+                if page_props is None:
+                    pending.append((index, page_url))
+                else:
+                    results[index] = _save_page_props(page_url, page_props)
+
+            if pending:
+                print(f"Falling back to Selenium for {len(pending)} page(s)...")
+
+        if not pending:
+            return results
+
+        worker_count = min(max_workers, len(pending))
+        drivers: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+        pool_drivers: List[webdriver.Chrome] = []
+
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            try:
+                if self.driver is not None:
+                    drivers.put(self.driver)
+
+                # Start the remaining browsers in parallel, since each one takes seconds to launch
+                for future in [executor.submit(self._create_driver) for _ in range(worker_count - drivers.qsize())]:
+                    try:
+                        driver = future.result()
+                    except Exception as e:
+                        print(f"Error starting WebDriver: {e}")
+                        continue
+                    pool_drivers.append(driver)
+                    drivers.put(driver)
+
+                if drivers.empty():
+                    print("Failed to start any WebDriver, nothing was extracted with Selenium")
+                    return results
+
+                worker = partial(self._extract_and_save_pooled, drivers, worker_count)
+                pending_urls = [page_url for _, page_url in pending]
+                for (index, _), success in zip(pending, executor.map(worker, range(len(pending)), pending_urls)):
+                    results[index] = success
+            finally:
+                # The extractor's own WebDriver stays open until the extractor is closed
+                for driver in pool_drivers:
+                    driver.quit()
+
+        return results
 
 
 def extract_next_data(homepage_url: str, page_url: str, headless: bool = True, 
-                  blocked_domains: Optional[List[str]] = None) -> bool:
+                  blocked_domains: Optional[Collection[str]] = None, fast_mode: bool = False) -> bool:
     """
     Extract pageProps data from a Next.js page using Selenium and save it to a JSON file.
     This function maintains backward compatibility with the previous API.
@@ -288,10 +756,12 @@ def extract_next_data(homepage_url: str, page_url: str, headless: bool = True,
         homepage_url (str): The homepage URL of the website (used for cookie handling)
         page_url (str): The URL of the Next.js page to extract data from
         headless (bool): Whether to run the Selenium browser in headless mode
-        blocked_domains (List[str], optional): List of domains to block. If None, uses DEFAULT_BLOCKED_DOMAINS
+        blocked_domains (Collection[str], optional): Domains to block (e.g. a list or set). If None, uses DEFAULT_BLOCKED_DOMAINS
+        fast_mode (bool): Whether to first try reading __NEXT_DATA__ over plain HTTP
 
     Returns:
         bool: True if extraction and saving succeeded, False otherwise
     """
-    extractor = NextDataExtractor(homepage_url, headless=headless, blocked_domains=blocked_domains)
-    return extractor.extract_and_save(page_url)
+    with NextDataExtractor(homepage_url, headless=headless, blocked_domains=blocked_domains,
+                           fast_mode=fast_mode) as extractor:
+        return extractor.extract_and_save(page_url)